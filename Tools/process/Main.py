@@ -1,16 +1,96 @@
-import subprocess
+import asyncio
+import concurrent.futures
+import functools
+import math
+import os
 import sys
-import platform
-import json # Keep json for potential future use, though not strictly needed for reading passed dict
+import threading
+import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 try:
-    from ....printer import print, print_error, print_verbose, print_debug, colours
+    from ....printer import print, print_error, print_verbose, print_debug, colours, DEBUG
 except ImportError:
-    from printer import print, print_error, print_verbose, print_debug, colours
+    from printer import print, print_error, print_verbose, print_debug, colours, DEBUG
 
 
+# Resolved FFmpeg locations are persisted here (under the project directory) between runs
+FFMPEG_CACHE_FILENAME = "_ffmpeg_cache.json"
+# Source signatures of completed conversions are persisted here (under the target directory)
+MANIFEST_FILENAME = ".manifest.json"
+# Only the end of FFmpeg's stderr is kept for error reports; the rest is discarded as it streams in
+STDERR_TAIL_BYTES = 16 * 1024
+# How often (seconds) a blocked producer (full queue, or FFmpeg lookup pending) checks whether the pipeline has stopped
+QUEUE_PUT_POLL_SECONDS = 0.1
+# Default number of files converted by a single FFmpeg process when only one runs at a time
+# (Tools.batch_size overrides it; with several workers files are converted one per process by default)
+DEFAULT_BATCH_SIZE = 16
+
+
+def load_json_cache(cache_path: Path) -> Dict[str, Any]:
+    """
+    Loads a JSON cache file, returning an empty cache if it is missing or unreadable.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_json_cache(cache_path: Path, cache: Dict[str, Any]) -> None:
+    """
+    Writes a JSON cache file. Failures are not fatal; the next run simply does the work again.
+    """
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=4)
+    except OSError as e:
+        print_verbose(f"Could not write cache file {cache_path}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
 def find_ffmpeg(config_path: str, project_dir: Path, module_dir: Path) -> Optional[str]:
+    """
+    Locates the ffmpeg executable, reusing the result cached in FFMPEG_CACHE_FILENAME
+    while the cached binary's mtime and size are unchanged. Otherwise falls back to
+    search_ffmpeg() and records the new result. Memoized for the lifetime of the process.
+
+    Args:
+        config_path (str): The path string from the configuration file.
+        project_dir (Path): The absolute path to the project directory.
+        module_dir (Path): The absolute path to the current module directory.
+
+    Returns:
+        Optional[str]: The resolved path to the ffmpeg executable, None if not found.
+    """
+    cache_path = project_dir / FFMPEG_CACHE_FILENAME
+    cache = load_json_cache(cache_path)
+
+    cached = cache.get(config_path)
+    if isinstance(cached, dict):
+        try:
+            st = os.stat(cached['resolved'])
+            if (st.st_mtime, st.st_size) == (cached['mtime'], cached['size']):
+                print_verbose(f"Using cached FFmpeg location: {cached['resolved']}")
+                return cached['resolved']
+        except (OSError, KeyError, TypeError):
+            pass # Stale or malformed entry, search again
+        print_verbose(f"Cached FFmpeg location for '{config_path}' is stale.")
+
+    resolved = search_ffmpeg(config_path, project_dir, module_dir)
+    if resolved:
+        try:
+            st = os.stat(resolved)
+            cache[config_path] = {'resolved': resolved, 'mtime': st.st_mtime, 'size': st.st_size}
+            save_json_cache(cache_path, cache)
+        except OSError as e:
+            print_verbose(f"Could not stat FFmpeg at {resolved}, not caching it: {e}")
+    return resolved
+
+
+def search_ffmpeg(config_path: str, project_dir: Path, module_dir: Path) -> Optional[str]:
     """
     Tries to locate the ffmpeg executable based on the config path.
     Checks:
@@ -25,8 +105,7 @@ def find_ffmpeg(config_path: str, project_dir: Path, module_dir: Path) -> Option
         module_dir (Path): The absolute path to the current module directory.
 
     Returns:
-        Optional[str]: The resolved path to the ffmpeg executable or the name itself
-                       if found in PATH, None otherwise.
+        Optional[str]: The resolved path to the ffmpeg executable, None otherwise.
     """
     ffmpeg_p = Path(config_path)
 
@@ -36,7 +115,7 @@ def find_ffmpeg(config_path: str, project_dir: Path, module_dir: Path) -> Option
             print_verbose(f"FFmpeg path is absolute: {ffmpeg_p}")
             return str(ffmpeg_p)
         else:
-            print_warning(f"Absolute FFmpeg path specified but not found: {ffmpeg_p}")
+            print(colours.YELLOW, f"Absolute FFmpeg path specified but not found: {ffmpeg_p}")
             # Continue searching other possibilities
 
     # 2. Check relative to project directory
@@ -51,19 +130,371 @@ def find_ffmpeg(config_path: str, project_dir: Path, module_dir: Path) -> Option
         print_verbose(f"Found FFmpeg relative to module dir: {mod_relative_path}")
         return str(mod_relative_path.resolve())
 
-    # 4. Assume it's in PATH and verify
+    # 4. Search the system PATH directly for a bare executable name, as where/which would,
+    # without spawning either of them. On Windows, names without an extension also try PATHEXT.
     print_verbose(f"Checking if '{config_path}' is in system PATH...")
+    if os.path.basename(config_path) == config_path:
+        suffixes = [""]
+        if os.name == "nt" and not os.path.splitext(config_path)[1]:
+            suffixes += os.environ.get("PATHEXT", ".EXE").split(os.pathsep)
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            if not directory:
+                continue
+            for suffix in suffixes:
+                candidate = os.path.join(directory, config_path + suffix)
+                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                    found_path = os.path.abspath(candidate)
+                    print_verbose(f"Found FFmpeg in PATH: {found_path}")
+                    # Return the full path so it can be cached and re-validated on later runs
+                    return found_path
+
+    print(colours.YELLOW, f"'{config_path}' not found as absolute, relative, or in system PATH.")
+    return None
+
+
+def positive_int_setting(tools: Dict[str, Any], key: str, default: int) -> int:
+    """
+    Reads an optional positive integer from the 'Tools' config section, falling back
+    to default (with a warning) when the value is missing, not a number, or below 1.
+    """
+    value = tools.get(key)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = 0
+    if number < 1:
+        print(colours.YELLOW, f"Ignoring invalid Tools.{key} value {value!r}, using {default}.")
+        return default
+    return number
+
+
+def iter_vp6(root: str) -> Iterator[str]:
+    """
+    Recursively yields the paths of .vp6 files (case-insensitive) under root.
+    Uses os.scandir directly so file type checks come from the cached directory
+    entry instead of an extra stat per file. Directory symlinks are not followed, and
+    directories that can't be read are skipped, as Path.rglob does.
+
+    Args:
+        root (str): The directory to search.
+
+    Yields:
+        str: The path of each .vp6 file found.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except PermissionError as e:
+            print_verbose(f"Skipping unreadable directory '{directory}': {e}")
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name[-4:].lower() == ".vp6" and entry.is_file(): # Lowercase only the suffix, not the whole name
+                    yield entry.path
+
+
+def output_paths(file_path: str, source_dir: str, target_dir: str) -> Tuple[str, str]:
+    """
+    Maps a .vp6 file found under source_dir to its .ogv output under target_dir.
+    Works on plain strings (file_path must start with source_dir, as iter_vp6 yields)
+    to keep pathlib object churn out of the per-file path.
+
+    Returns:
+        Tuple[str, str]: The file's path relative to source_dir, and the .ogv output path.
+    """
+    relative_path = file_path[len(os.path.join(source_dir, "")):]
+    ogv_file = os.path.join(target_dir, os.path.splitext(relative_path)[0] + ".ogv")
+    return relative_path, ogv_file
+
+
+def iter_conversion_jobs(source_dir: str, target_dir: str, ready: threading.Event, stop: threading.Event) -> Iterator[Tuple[str, str, str]]:
+    """
+    Walks source_dir for .vp6 files and yields a conversion job for each, creating
+    each distinct target directory the first time a file needing it is seen.
+    Nothing is created until `ready` is set (FFmpeg has been found), so a run that
+    can't convert anything leaves the target tree untouched. Stops early once `stop` is set.
+
+    Yields:
+        Tuple[str, str, str]: The .vp6 path, its path relative to source_dir, and its .ogv output path.
+    """
+    created_dirs = set()
+    for file_path in iter_vp6(source_dir):
+        if stop.is_set():
+            return
+        relative_path, ogv_file = output_paths(file_path, source_dir, target_dir)
+        directory = os.path.dirname(ogv_file)
+        if directory not in created_dirs:
+            while not ready.wait(QUEUE_PUT_POLL_SECONDS):
+                if stop.is_set():
+                    return
+            os.makedirs(directory, exist_ok=True)
+            created_dirs.add(directory)
+        yield file_path, relative_path, ogv_file
+
+
+async def read_tail(stream: asyncio.StreamReader, limit: int) -> str:
+    """
+    Drains a stream to EOF, keeping only roughly its last `limit` bytes.
+
+    Returns:
+        str: The retained tail, decoded and trimmed to start at a line boundary if it was cut.
+    """
+    tail = bytearray()
+    truncated = False
+    while chunk := await stream.read(4096):
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
+            truncated = True
+    if truncated:
+        # Drop the partial first line left by the cut
+        newline = tail.find(b"\n")
+        if newline != -1:
+            del tail[:newline + 1]
+    return tail.decode(errors="replace")
+
+
+def stale_signature(file_path: str, relative_path: str, ogv_file: str, manifest: Dict[str, Any], adopt_existing: bool) -> Tuple[str, Optional[List[float]]]:
+    """
+    Decides whether a .vp6 file needs converting, using the manifest of completed conversions.
+
+    A file is up to date when its output exists and the manifest's (mtime, size) signature for the
+    source still matches. When adopt_existing is set (no manifest has been written yet), outputs
+    that already exist are assumed to predate the manifest and are adopted into it.
+
+    Returns:
+        Tuple[str, Optional[List[float]]]: The file's manifest key, and the source's current
+            signature if it needs converting (None if it is up to date).
+    """
+    manifest_key = relative_path.replace(os.sep, "/")
+    st = os.stat(file_path)
+    signature = [st.st_mtime, st.st_size]
+
+    recorded = manifest.get(manifest_key)
+    if recorded == signature and os.path.exists(ogv_file):
+        return manifest_key, None
+
+    # Without a manifest, an existing output was converted before the manifest existed. Once there
+    # is one, a missing entry means the conversion never completed (the output may be truncated).
+    if adopt_existing and recorded is None and os.path.exists(ogv_file):
+        manifest[manifest_key] = signature
+        return manifest_key, None
+
+    return manifest_key, signature
+
+
+def build_ffmpeg_command(ffmpeg_executable: str, files: List[Tuple[str, str]], encoder_threads: int) -> List[str]:
+    """
+    Builds one FFmpeg command converting each (.vp6, .ogv) pair in files. Several pairs share a
+    single FFmpeg process, each input mapped to its own output with the same encode settings.
+    """
+    cmd = [
+        ffmpeg_executable,
+        "-y",  # Overwrite output files without asking (outputs are only converted when stale)
+        "-nostdin",           # Never read from the console, which concurrent processes would fight over
+    ]
+    for file_path, _ in files:
+        cmd += ["-i", file_path] # Input files
+    for index, (_, ogv_file) in enumerate(files):
+        cmd += [
+            "-map", f"{index}:v:0?", "-map", f"{index}:a:0?", # This input's first video/audio streams go to this output only
+            "-c:v", "libtheora",  # Video codec
+            "-q:v", "10",          # Video quality (0-10 for Theora, higher is better)
+            "-c:a", "libvorbis",  # Audio codec
+            "-q:a", "10",          # Audio quality (0-10 for Vorbis, higher is better)
+            "-threads", str(encoder_threads), # Encoder threads (output option, so it must follow -i)
+            ogv_file              # Output file
+        ]
+    return cmd
+
+
+async def run_ffmpeg(cmd: List[str]) -> Tuple[int, str]:
+    """
+    Runs an FFmpeg command to completion.
+
+    Returns:
+        Tuple[int, str]: FFmpeg's return code and the tail of its stderr output.
+    """
+    if DEBUG: print_debug(f"Running command: {' '.join(cmd)}") # Skip joining the command line when debug is off
+
+    # Pipe stderr so output from concurrent FFmpeg processes doesn't interleave on the console
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    stderr_tail, _ = await asyncio.gather(read_tail(proc.stderr, STDERR_TAIL_BYTES), proc.wait())
+    return proc.returncode, stderr_tail
+
+
+async def convert_batch(files: List[Tuple[str, str]], ffmpeg_executable: str, encoder_threads: int) -> List[Tuple[int, str]]:
+    """
+    Converts (.vp6, .ogv) pairs whose output directories already exist, sharing one FFmpeg process
+    between them. If that process fails, each file is retried on its own so a single bad input
+    only fails itself.
+
+    Returns:
+        List[Tuple[int, str]]: FFmpeg's return code and stderr tail for each pair, in order.
+    """
+    if len(files) > 1:
+        returncode, stderr_tail = await run_ffmpeg(build_ffmpeg_command(ffmpeg_executable, files, encoder_threads))
+        if returncode == 0:
+            return [(0, "")] * len(files)
+        print_verbose(f"Batch of {len(files)} files failed (code {returncode}), converting them individually.")
+
+    return [await run_ffmpeg(build_ffmpeg_command(ffmpeg_executable, [pair], encoder_threads)) for pair in files]
+
+
+async def convert_all(ffmpeg_path_str: str, project_dir: Path, module_dir: Path, source_dir: str, target_dir: str, max_workers: int, batch_size: int, manifest: Dict[str, Any], adopt_existing: bool) -> Tuple[Optional[str], int, int]:
+    """
+    Finds and converts the .vp6 files under source_dir as a pipeline: a producer thread walks
+    the source tree and feeds a bounded queue while max_workers consumers convert files from it,
+    so encoding starts before the walk finishes. The producer also does the manifest/stat checks,
+    so they overlap with encoding and only stale files are queued. Each consumer takes up to
+    batch_size files that are already queued, but no more than its share of the queue across
+    max_workers consumers, and converts them with one FFmpeg process. The FFmpeg lookup runs
+    alongside the walk, and consumers wait for it before converting anything. Successful
+    conversions are recorded in manifest, and failed ones have their partial output removed.
+    adopt_existing is passed on to stale_signature().
+
+    Returns:
+        Tuple[Optional[str], int, int]: The result of find_ffmpeg() (None means nothing was converted),
+            the number of .vp6 files found, and the number of files that failed to convert.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_workers * batch_size * 2)
+    stop = threading.Event()
+    ffmpeg_found = threading.Event() # Target directories are only created once this is set
+    # With several files encoding at once, one thread each avoids oversubscribing the CPU;
+    # a lone FFmpeg process is left to pick its own thread count
+    encoder_threads = 1 if max_workers > 1 else 0
+    # Each counter is only updated from one side: the producer thread, or the consumers on the event loop
+    found = 0
+    check_errors = 0
+    conversion_errors = 0
+
+    async def locate_ffmpeg() -> Optional[str]:
+        ffmpeg_executable = await asyncio.to_thread(find_ffmpeg, ffmpeg_path_str, project_dir, module_dir)
+        if ffmpeg_executable:
+            print(colours.CYAN, f"Using FFmpeg: {ffmpeg_executable}")
+            ffmpeg_found.set()
+        else:
+            stop.set() # Nothing can be converted, so stop walking the source tree
+        return ffmpeg_executable
+
+    def walk() -> None:
+        nonlocal found, check_errors
+        for job in iter_conversion_jobs(source_dir, target_dir, ffmpeg_found, stop):
+            found += 1
+            file_path, relative_path, ogv_file = job
+            try:
+                manifest_key, signature = stale_signature(file_path, relative_path, ogv_file, manifest, adopt_existing)
+            except OSError as e:
+                check_errors += 1
+                print_error(f"An unexpected error occurred processing '{os.path.basename(file_path)}': {e}")
+                continue
+            if signature is None:
+                print(colours.YELLOW, f"Skipping: Output '{os.path.basename(ogv_file)}' is up to date.")
+                continue
+            # Blocks this thread while the queue is full, giving up if the consumers have stopped
+            put = asyncio.run_coroutine_threadsafe(queue.put((job, manifest_key, signature)), loop)
+            while True:
+                try:
+                    put.result(timeout=QUEUE_PUT_POLL_SECONDS)
+                    break
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        put.cancel()
+                        return
+
+    async def produce() -> None:
+        try:
+            await asyncio.to_thread(walk)
+        finally:
+            # One sentinel per consumer, sent even if the walk failed so every consumer exits.
+            # Once stopped, the consumers may be gone and nothing would drain a full queue,
+            # so pending jobs are dropped to make room instead of waiting for it.
+            if stop.is_set():
+                while not queue.empty():
+                    queue.get_nowait()
+                for _ in range(max_workers):
+                    queue.put_nowait(None)
+            else:
+                for _ in range(max_workers):
+                    await queue.put(None)
+
+    async def convert_and_report(ffmpeg_executable: str, batch: List[Tuple[Tuple[str, str, str], str, List[float]]]) -> None:
+        nonlocal conversion_errors
+        try:
+            results = await convert_batch([(file_path, ogv_file) for (file_path, _, ogv_file), _, _ in batch], ffmpeg_executable, encoder_threads)
+        except Exception as e:
+            conversion_errors += len(batch)
+            for (file_path, _, _), _, _ in batch:
+                print_error(f"An unexpected error occurred processing '{os.path.basename(file_path)}': {e}")
+            return
+
+        for ((file_path, _, ogv_file), manifest_key, signature), (returncode, error_output) in zip(batch, results):
+            file_name = os.path.basename(file_path)
+            if returncode == 0:
+                manifest[manifest_key] = signature
+                print(colours.GREEN, f"  Success: Converted '{file_name}' -> '{os.path.basename(ogv_file)}'")
+            else:
+                conversion_errors += 1
+                print_error(f"  Error converting '{file_name}'. FFmpeg returned code {returncode}.")
+                if error_output:
+                    print_error(error_output.strip())
+                # Don't leave a truncated output behind for a later run to mistake for a finished one
+                try:
+                    os.remove(ogv_file)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print_verbose(f"Could not remove incomplete output '{ogv_file}': {e}")
+
+    async def consume() -> None:
+        ffmpeg_executable = await ffmpeg_lookup
+        if not ffmpeg_executable:
+            # Drain the queue so the producer can finish
+            while await queue.get() is not None:
+                pass
+            return
+
+        finished = False
+        while not finished:
+            batch: List[Tuple[Tuple[str, str, str], str, List[float]]] = []
+            item = await queue.get()
+            # Take whatever else is already queued, up to batch_size files but only this consumer's
+            # share of the queue, so one process doesn't encode files serially while others sit idle
+            limit = min(batch_size, math.ceil((queue.qsize() + 1) / max_workers))
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= limit or queue.empty():
+                    break
+                item = queue.get_nowait()
+            else:
+                finished = True
+            if batch:
+                await convert_and_report(ffmpeg_executable, batch)
+
+    ffmpeg_lookup = asyncio.create_task(locate_ffmpeg())
+    producer = asyncio.create_task(produce())
+    consumers = [asyncio.create_task(consume()) for _ in range(max_workers)]
     try:
-        # Use 'where' on Windows or 'which' on Unix-like systems
-        cmd = ["where", config_path] if platform.system() == "Windows" else ["which", config_path]
-        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        found_path = result.stdout.strip().splitlines()[0] # Take the first result if multiple
-        print_verbose(f"Found FFmpeg in PATH: {found_path}")
-        # Return the original name, as subprocess can often find it via PATH
-        return config_path
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        print_warning(f"'{config_path}' not found as absolute, relative, or in system PATH.")
-        return None
+        await asyncio.gather(*consumers)
+    except BaseException:
+        # A consumer failed or the run was cancelled: stop the walk for jobs nobody will take,
+        # and wind down the remaining tasks before the error propagates
+        stop.set()
+        for task in (*consumers, producer):
+            task.cancel()
+        await asyncio.gather(*consumers, producer, return_exceptions=True)
+        raise
+    await producer # Re-raises any error from walking the source tree or creating target directories
+    return await ffmpeg_lookup, found, check_errors + conversion_errors
 
 
 def main(project_dir: Path, module_dir: Path, config: Dict[str, Any]):
@@ -100,80 +531,44 @@ def main(project_dir: Path, module_dir: Path, config: Dict[str, Any]):
         print_error(f"Source directory not found: {source_dir}")
         sys.exit(1)
 
-    # --- Locate FFmpeg ---
-    ffmpeg_executable = find_ffmpeg(ffmpeg_path_str, project_dir, module_dir)
+    tools = config['Tools']
+    max_workers = positive_int_setting(tools, 'max_workers', os.cpu_count() or 1) # cpu_count() can be None
+    # Batching only saves FFmpeg startup time, which is small next to encoding a file, so with several
+    # workers each file gets its own process unless Tools.batch_size asks otherwise
+    batch_size = positive_int_setting(tools, 'batch_size', DEFAULT_BATCH_SIZE if max_workers == 1 else 1)
+    print_verbose(f"Running up to {max_workers} FFmpeg process(es) concurrently, {batch_size} file(s) each.")
+
+    # Read the manifest once up front and write it back once at the end, not per file
+    manifest_path = target_dir / MANIFEST_FILENAME
+    # Existing outputs are only adopted on the first run, before any manifest was written
+    adopt_existing = not manifest_path.exists()
+    manifest = load_json_cache(manifest_path)
+
+    # --- Locate FFmpeg, Find and Process Files ---
+    # Past this point paths are handled as plain strings; pathlib is only used for setup
+    try:
+        ffmpeg_executable, found, conversion_errors = asyncio.run(
+            convert_all(ffmpeg_path_str, project_dir, module_dir, str(source_dir), str(target_dir), max_workers, batch_size, manifest, adopt_existing)
+        )
+    except OSError as e:
+        print_error(f"Error scanning source files or creating target directories: {e}")
+        sys.exit(1)
+    finally:
+        # Saved even if the run failed or was interrupted, so finished conversions aren't redone
+        # (nothing is written until there is something to record, keeping the first-run adoption)
+        if manifest or not adopt_existing:
+            save_json_cache(manifest_path, manifest)
+
     if not ffmpeg_executable:
         print_error(f"FFmpeg executable could not be located based on config value: '{ffmpeg_path_str}'")
         sys.exit(1)
-    print(colours.CYAN, f"Using FFmpeg: {ffmpeg_executable}")
-
 
-    # --- Find and Process Files ---
-    # Use pathlib's rglob for recursive search
-    vp6_files = list(source_dir.rglob("*.vp6"))
-
-    if not vp6_files:
+    if not found:
         print(colours.YELLOW, "No .vp6 files found in source directory.")
         print(colours.CYAN, "--- Video Conversion Process Finished (No files) ---")
         return
 
-    print(colours.CYAN, f"Found {len(vp6_files)} .vp6 files of the 172 expected files.")
-
-    conversion_errors = 0
-    # Iterate through each .vp6 file
-    for file_path in vp6_files:
-        try:
-            # Calculate relative path within source_dir for structuring target
-            relative_path = file_path.relative_to(source_dir)
-            target_path_base = target_dir / relative_path.parent / file_path.stem # Target dir + subdirs + filename without ext
-            ogv_file = target_path_base.with_suffix(".ogv") # Add .ogv suffix
-
-            # Ensure target directory exists
-            ogv_file.parent.mkdir(parents=True, exist_ok=True) # Creates parent dirs as needed
-
-            # Check if output file already exists
-            if ogv_file.exists():
-                print(colours.YELLOW, f"Skipping: Output '{ogv_file.name}' already exists.")
-                continue
-
-            # Print conversion message
-            print(colours.CYAN, f"Converting '{file_path.name}' -> '{ogv_file.name}'")
-            print_verbose(f"  Source: {file_path}")
-            print_verbose(f"  Target: {ogv_file}")
-
-            # Run ffmpeg command
-            cmd = [
-                ffmpeg_executable,
-                "-y",  # Overwrite output files without asking (redundant due to check above, but safe)
-                "-i", str(file_path), # Input file
-                "-c:v", "libtheora",  # Video codec
-                "-q:v", "10",          # Video quality (0-10 for Theora, higher is better)
-                "-c:a", "libvorbis",  # Audio codec
-                "-q:a", "10",          # Audio quality (0-10 for Vorbis, higher is better)
-                str(ogv_file)         # Output file
-            ]
-            print_debug(f"Running command: {' '.join(cmd)}")
-
-            # Run the command and let its output go directly to the console
-            # No shell=True needed if ffmpeg_executable is properly resolved/quoted internally by subprocess
-            result = subprocess.run(cmd, check=False) # check=False allows us to inspect returncode
-
-            if result.returncode == 0:
-                print(colours.GREEN, f"  Success: Conversion completed for {ogv_file.name}")
-            else:
-                conversion_errors += 1
-                print_error(f"  Error converting '{file_path.name}'. FFmpeg returned code {result.returncode}.")
-                # FFmpeg's detailed error output should have gone to stderr already
-                # Optional: Exit on first error
-                # print_error("Exiting due to conversion error.")
-                # sys.exit(1)
-
-        except Exception as e:
-            conversion_errors += 1
-            print_error(f"An unexpected error occurred processing '{file_path.name}': {e}")
-            # Optional: Exit on first error
-            # print_error("Exiting due to unexpected error.")
-            # sys.exit(1)
+    print(colours.CYAN, f"Processed {found} .vp6 files of the 172 expected files.")
 
     # --- Final Summary ---
     print(colours.CYAN, "--- Video Conversion Process Finished ---")
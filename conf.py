@@ -3,6 +3,8 @@ This module handles the JSON-based initialization of the Video module,
 finding the 'project.json' file and ensuring the module's configuration
 is present within it.
 """
+from __future__ import annotations # Annotations stay unevaluated, so typing is only needed by type checkers
+
 try:
     # Assuming printer module is in the same parent directory or installed
     from .printer import print, print_error, print_verbose, print_debug, colours
@@ -11,16 +13,29 @@ except ImportError:
 
 
 import os
+import functools
 from pathlib import Path
 import json
 import time # Keep time if needed for debugging sleeps
-from typing import Optional, Tuple, Dict, Any
+
+# Type checkers treat this name as true; at runtime typing is never imported
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Tuple, Dict, Any
+
+# Loaded configs keyed on (module_dir, project_dir), stored as (project.json st_mtime_ns, conf_path, config_data)
+_CONF_CACHE: Dict[Tuple[Path, Path], Tuple[int, Path, Dict[str, Any]]] = {}
 
 # --- Re-usable function (potentially moved to a shared utils module) ---
+# How far up find_project_json looks: the start directory plus this many parents
+MAX_SEARCH_LEVELS = 2
+
 # Modified find_project_json from Extract module for slightly better handling
 def find_project_json(start_dir: Path) -> Optional[Path]:
     """
-    Finds a 'project.json' file in the specified directory or its parent directories.
+    Finds a 'project.json' file in the specified directory or its parent directories,
+    logging where it was found. The search itself is memoized per resolved start
+    directory for the lifetime of the process.
 
     Args:
         start_dir (Path): The starting directory for the search.
@@ -29,41 +44,101 @@ def find_project_json(start_dir: Path) -> Optional[Path]:
         Optional[Path]: The Path object for the directory containing project.json,
                         or None if not found within the search depth.
     """
-    current_dir = start_dir.resolve()
-    max_levels = 2  # Search current + 2 parents
-    project_json_path = None
-
-    for i in range(max_levels + 1):
-        candidate = current_dir / "project.json"
-        print_debug(f"Searching for project.json at: {candidate}")
-        if candidate.exists() and candidate.is_file():
-            project_json_path = candidate
-            print(colours.CYAN, f"INFO 3: Found project.json at {project_json_path}")
-            break
-        if i < max_levels: # Don't go beyond max_levels parent
-             # Check if we reached the root
-            if current_dir.parent == current_dir:
-                 print_debug(f"Reached filesystem root while searching.")
-                 break
-            current_dir = current_dir.parent
-        else:
-            print_debug(f"Reached max search depth ({max_levels} levels).")
-
+    project_json_path = _search_project_json(start_dir.resolve())
 
     if project_json_path:
         project_dir = project_json_path.parent
+        print(colours.CYAN, f"INFO 3: Found project.json at {project_json_path}")
         print(colours.CYAN, f"INFO 4: Project directory determined as: {project_dir}")
         return project_dir
     else:
-        print(colours.YELLOW, f"WARN 4: project.json not found within {max_levels} levels starting from {start_dir}.")
+        print(colours.YELLOW, f"WARN 4: project.json not found within {MAX_SEARCH_LEVELS} levels starting from {start_dir}.")
         # Decide what to do: return start_dir's parent? Or start_dir? Or None?
         # Returning None indicates it wasn't found according to the search rule.
         # Let's return None and let the caller decide the fallback.
         # Alternatively, default to parent of start_dir: return start_dir.resolve().parent
         return None
 
+def find_project_dir_quiet(start_dir: Path) -> Optional[Path]:
+    """
+    Performs the same (memoized) search as find_project_json without logging anything,
+    for callers that only need the directory before or instead of a full initialization.
+    """
+    project_json_path = _search_project_json(start_dir.resolve())
+    return project_json_path.parent if project_json_path else None
+
+def clear_project_json_cache() -> None:
+    """
+    Forgets the memoized project.json search results, so the next lookup searches again.
+    """
+    _search_project_json.cache_clear()
+
+@functools.lru_cache(maxsize=None)
+def _search_project_json(start_dir: Path) -> Optional[Path]:
+    """
+    Returns the path of the nearest project.json within MAX_SEARCH_LEVELS of start_dir,
+    or None. start_dir must already be resolved.
+    """
+    # Fast path: project.json almost always sits in the module dir or its immediate parent
+    for candidate_dir in (start_dir, start_dir.parent):
+        candidate = candidate_dir / "project.json"
+        if os.path.isfile(candidate):
+            return candidate
+
+    # The fast path already checked the first two levels, so carry on from start_dir's parent
+    current_dir = start_dir.parent
+    for i in range(2, MAX_SEARCH_LEVELS + 1):
+        # Check if we reached the root
+        if current_dir.parent == current_dir:
+            print_debug(f"Reached filesystem root while searching.")
+            break
+        current_dir = current_dir.parent
+        candidate = current_dir / "project.json"
+        if os.path.isfile(candidate):
+            return candidate
+    else:
+        print_debug(f"Reached max search depth ({MAX_SEARCH_LEVELS} levels).")
+    return None
+
 # --- Video Module Specific Functions ---
 
+def get_cached_conf(module_dir: Path, project_dir: Path) -> Optional[Tuple[Path, Dict[str, Any]]]:
+    """
+    Returns the configuration loaded by an earlier call for these directories,
+    as long as project.json hasn't been modified since.
+
+    Returns:
+        Optional[tuple[Path, dict]]: The resolved project.json path and the config object,
+                                     or None if nothing usable is cached.
+    """
+    cache_key = (module_dir, project_dir)
+    cached = _CONF_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    try:
+        if os.stat(project_dir / "project.json").st_mtime_ns == cached[0]:
+            return cached[1], cached[2]
+    except OSError:
+        pass # File vanished, the caller has to recreate it
+    del _CONF_CACHE[cache_key]
+    return None
+
+def cache_conf(module_dir: Path, project_dir: Path, config_data: Dict[str, Any], mtime_ns: int) -> Path:
+    """
+    Records config_data as the configuration in project_dir's project.json,
+    for get_cached_conf to return until the file is modified.
+
+    Args:
+        mtime_ns (int): project.json's st_mtime_ns, taken before config_data was read from it,
+                        so an edit made while it was being parsed makes the entry stale, not wrong.
+
+    Returns:
+        Path: The resolved path to project.json.
+    """
+    resolved_conf_path = (project_dir / "project.json").resolve()
+    _CONF_CACHE[(module_dir, project_dir)] = (mtime_ns, resolved_conf_path, config_data)
+    return resolved_conf_path
+
 def create_or_update_conf(module_dir: Path, project_dir: Path) -> Tuple[Path, Dict[str, Any]]:
     """
     Creates or updates the configuration for the Video module within the project.json file.
@@ -88,12 +163,26 @@ def create_or_update_conf(module_dir: Path, project_dir: Path) -> Tuple[Path, Di
     module_name = "Video"
     config_data: Dict[str, Any] = {}
 
+    # Step 0: Reuse the config loaded by an earlier call unless project.json has changed since
+    cached = get_cached_conf(module_dir, project_dir)
+    if cached is not None:
+        print_debug(f"Using cached configuration for {conf_path}")
+        return cached
+
     # Step 1: Load existing configuration if project.json exists
     if conf_path.exists() and conf_path.is_file():
         print(colours.CYAN, f"INFO 6: Found configuration file: {conf_path}")
         try:
-            with open(conf_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # orjson is an optional, much faster parser, imported only when there is something to parse;
+            # its JSONDecodeError subclasses json.JSONDecodeError
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+            with open(conf_path, 'rb') as f:
+                conf_mtime_ns = os.fstat(f.fileno()).st_mtime_ns # Taken before reading, for the cache
+                raw = f.read()
+            config_data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
             if not isinstance(config_data, dict):
                 print_error(f"Invalid JSON structure in {conf_path}. Expected a dictionary (object). Starting fresh.")
                 config_data = {}
@@ -137,15 +226,24 @@ def create_or_update_conf(module_dir: Path, project_dir: Path) -> Tuple[Path, Di
         config_data[module_name] = default_module_config
 
         # Step 3: Write the updated configuration back to project.json
+        # Serialize in memory, write a temp file beside it and rename over the original,
+        # so an interrupted write can never leave a truncated project.json behind
+        payload = json.dumps(config_data, indent=4).encode('utf-8') # Use indent for readability
+        tmp_path = conf_path.with_suffix('.json.tmp')
         try:
-            with open(conf_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4) # Use indent for readability
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                conf_mtime_ns = os.fstat(f.fileno()).st_mtime_ns # Kept by the rename below
+            os.replace(tmp_path, conf_path)
             print(colours.GREEN, f"INFO 8: Successfully updated {conf_path} with configuration for module '{module_name}'.")
         except IOError as e:
             print_error(f"Error writing configuration file {conf_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
             raise # Re-raise the error
 
-    return conf_path.resolve(), config_data
+    return cache_conf(module_dir, project_dir, config_data, conf_mtime_ns), config_data
 
 
 def main(module_dir: Path) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
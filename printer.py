@@ -3,7 +3,6 @@ This module provides utility functions for logging messages with ANSI colour cod
 It includes functions for standard, error, verbose, and debug logging.
 """
 
-import builtins
 import sys
 import os  # Import os for environment variable check
 
@@ -22,6 +21,15 @@ class colours(object):
     GRAY = '\033[90m'
     DARK_GREEN = '\033[32m'
 
+# --- Precomputed Output Pieces ---
+# The environment is read once at import; the logging functions only test these flags.
+# Callers can also test them to skip formatting a message that won't be shown.
+VERBOSE = os.environ.get("VERBOSE", "").lower() == "true"
+DEBUG = os.environ.get("DEBUG", "").lower() == "true"
+_RESET_NL = colours.RESET + "\n"
+_VERBOSE_PREFIX = colours.GRAY + "VERBOSE: "
+_DEBUG_PREFIX = colours.MAGENTA + "DEBUG: "
+
 # --- Logging Functions ---
 def print(colour: str, message: str) -> None:  # Removed default colour
     """
@@ -30,7 +38,7 @@ def print(colour: str, message: str) -> None:  # Removed default colour
     :param colour: The ANSI colour code to format the message.
     :param message: The message to log.
     """
-    builtins.print(f"{colour}{message}{colours.RESET}", file=sys.stdout)
+    sys.stdout.write(colour + message + _RESET_NL)
 
 def print_error(message: str) -> None:
     """
@@ -38,7 +46,7 @@ def print_error(message: str) -> None:
 
     :param message: The error message to log.
     """
-    builtins.print(f"{colours.RED}{message}{colours.RESET}", file=sys.stderr)
+    sys.stderr.write(colours.RED + message + _RESET_NL)
 
 def print_verbose(message: str) -> None:
     """
@@ -46,8 +54,8 @@ def print_verbose(message: str) -> None:
 
     :param message: The verbose message to log.
     """
-    if "VERBOSE" in os.environ and os.environ["VERBOSE"].lower() == "true":
-        print(colours.GRAY, f"VERBOSE: {message}")
+    if VERBOSE:
+        sys.stdout.write(_VERBOSE_PREFIX + message + _RESET_NL)
 
 def print_debug(message: str) -> None:
     """
@@ -55,5 +63,5 @@ def print_debug(message: str) -> None:
 
     :param message: The debug message to log.
     """
-    if "DEBUG" in os.environ and os.environ["DEBUG"].lower() == "true":
-        print(colours.MAGENTA, f"DEBUG: {message}")
+    if DEBUG:
+        sys.stdout.write(_DEBUG_PREFIX + message + _RESET_NL)
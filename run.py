@@ -1,90 +1,363 @@
 # Video module's main run script (e.g., video_run.py or __main__.py)
 
+from __future__ import annotations # Annotations stay unevaluated, so typing is only needed by type checkers
+
 import sys
 import os
-import time
+import threading
+import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+
+# Type checkers treat this name as true; at runtime typing is never imported
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any, Tuple
 
 # --- Imports ---
-try:
+# Pick the import style once from the package context instead of falling back on ImportError
+if __package__:
     # Use relative imports if part of a package
-    from .printer import print, print_error, print_verbose, print_debug, colours
+    from .printer import print, print_error, print_verbose, print_debug, colours, VERBOSE, DEBUG
     from . import conf # Video module's conf script (JSON version)
-    from .Tools.process import Main as VideoProcessMain # Specific video processing main function/module
-except ImportError:
-    # Fallback for running script directly or different structure
-    from printer import print, print_error, print_verbose, print_debug, colours
+else:
+    # Running the script directly
+    from printer import print, print_error, print_verbose, print_debug, colours, VERBOSE, DEBUG
     import conf # Video module's conf script (JSON version)
-    from Tools.process import Main as VideoProcessMain # Specific video processing main function/module
+
+# The Video module's directory (where this script lives), resolved once at import
+_MODULE_DIR: Path = Path(__file__).resolve().parent
+
+# The video processing module is only imported once it's needed (see get_video_process_main)
+_video_process_main = None
+# Background thread importing the video processing module while the configuration loads
+_video_process_preload: Optional[threading.Thread] = None
+
+# --- Configuration Model ---
+# A plain slotted class rather than a dataclass, whose import (via inspect) costs more than this script's startup
+class VideoConfig:
+    """
+    The configuration values run.py needs, pulled out of project.json once at init.
+
+    Attributes:
+        mov_target_dir: The video output directory, relative to the project directory.
+        raw: The full configuration dictionary loaded from project.json.
+    """
+    __slots__ = ('mov_target_dir', 'raw')
+
+    def __init__(self, mov_target_dir: str, raw: Dict[str, Any]) -> None:
+        self.mov_target_dir = mov_target_dir
+        self.raw = raw
+
+# --- Configuration Cache ---
+# Parsed configurations are pickled here, one file per project.json, and reused while that file is unchanged.
+# Entries are keyed on (project.json path, st_mtime_ns, st_size); within a process, conf's own cache is used first.
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "video_module"
+
+def config_cache_key(conf_path: Path) -> Optional[Tuple[str, int, int]]:
+    """
+    Returns the cache key identifying the current contents of conf_path, or None if it can't be stat'ed.
+    """
+    try:
+        st = os.stat(conf_path)
+    except OSError:
+        return None
+    return str(conf_path), st.st_mtime_ns, st.st_size
+
+def config_cache_file(conf_path: Path) -> Path:
+    """
+    Returns the on-disk cache file used for the given project.json path.
+    """
+    import hashlib # Only needed when the on-disk cache is used
+    return CONFIG_CACHE_DIR / f"{hashlib.blake2b(str(conf_path).encode()).hexdigest()[:16]}.pkl"
+
+def load_cached_configuration(module_dir: Path, project_dir: Path, key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Returns the configuration cached for project_dir's project.json if the file still matches key
+    (from config_cache_key), checking conf's in-memory cache first and then the on-disk cache.
+    """
+    in_memory = conf.get_cached_conf(module_dir, project_dir)
+    if in_memory is not None:
+        return in_memory[1]
+
+    conf_path = project_dir / "project.json"
+    import pickle # Only needed once the in-memory cache misses
+    try:
+        with open(config_cache_file(conf_path), 'rb') as f:
+            cached_key, cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        if DEBUG: print_debug(f"No usable configuration cache for {conf_path}: {e}")
+        return None
+    if cached_key != key:
+        if DEBUG: print_debug(f"Configuration cache for {conf_path} is stale.")
+        return None
+
+    # Seed conf's cache so later loads in this process don't touch the disk cache
+    conf.cache_conf(module_dir, project_dir, cached[1], key[1])
+    return cached[1]
+
+def store_cached_configuration(project_dir: Path, config_data: Dict[str, Any], key: Tuple[str, int, int]) -> None:
+    """
+    Caches a configuration freshly loaded by conf.main (which keeps its own in-memory copy) on disk,
+    under the key taken before it was loaded. Failing to write the on-disk cache is not fatal;
+    the next run just parses project.json again.
+    """
+    conf_path = project_dir / "project.json"
+    cache_file = config_cache_file(conf_path)
+    tmp_file = cache_file.with_suffix('.pkl.tmp')
+    import pickle # Only needed when the on-disk cache is written
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((key, (project_dir, config_data)), f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        if VERBOSE: print_verbose(f"Could not write configuration cache {cache_file}: {e}")
+
+# --- Last Run State ---
+# Records the output directory and project.json seen by the last run that found the output already present
+LAST_RUN_STATE_FILENAME = ".last_run_state.json"
+
+def last_run_unchanged(module_dir: Path) -> bool:
+    """
+    Returns True if neither project.json nor the output directory has changed since the
+    last run recorded its state, meaning there is nothing new for this run to decide.
+    Only a few stats are needed, so the configuration doesn't have to be loaded.
+    """
+    try:
+        with open(module_dir / LAST_RUN_STATE_FILENAME, 'rb') as f:
+            raw = f.read()
+        state = json.loads(raw)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(state, dict):
+        return False
+
+    project_dir = conf.find_project_dir_quiet(module_dir) # This path prints nothing
+    if project_dir is None:
+        return False
+    conf_path = os.path.join(str(project_dir), "project.json")
+    if state.get('config') != conf_path:
+        return False
+    try:
+        conf_mtime_ns = os.stat(conf_path).st_mtime_ns
+        target_mtime_ns = os.stat(state['path']).st_mtime_ns
+    except (OSError, KeyError, TypeError, ValueError):
+        return False
+    return conf_mtime_ns == state.get('config_mtime_ns') and target_mtime_ns == state.get('mtime_ns')
+
+def save_last_run_state(module_dir: Path, project_dir: Path, target_path: str) -> None:
+    """
+    Records the current project.json and output directory modification times for
+    last_run_unchanged. Failing to write the file is not fatal.
+    """
+    conf_path = os.path.join(str(project_dir), "project.json")
+    state_file = module_dir / LAST_RUN_STATE_FILENAME
+    tmp_file = module_dir / (LAST_RUN_STATE_FILENAME + ".tmp")
+    try:
+        state = {
+            'path': target_path,
+            'mtime_ns': os.stat(target_path).st_mtime_ns,
+            'config': conf_path,
+            'config_mtime_ns': os.stat(conf_path).st_mtime_ns,
+        }
+        with open(tmp_file, 'wb') as f:
+            f.write(json.dumps(state).encode('utf-8'))
+        os.replace(tmp_file, state_file)
+    except OSError as e:
+        if VERBOSE: print_verbose(f"Could not write last run state {state_file}: {e}")
 
 # --- Initialization Function ---
-def initialize_configuration(module_dir: Path) -> tuple[Optional[Path], Optional[Dict[str, Any]]]:
+def initialize_configuration(module_dir: Path) -> tuple[Optional[Path], Optional[VideoConfig]]:
     """
     Initializes the configuration using the module's conf script and
-    returns the project directory path and the loaded configuration data.
+    returns the project directory path and the loaded configuration.
+    An unchanged project.json is served from the configuration cache without being re-parsed.
     """
     print(colours.CYAN, "Running init for Video Module.")
-    project_dir, config_data = conf.main(module_dir) # Calls Video's conf.main
-    if project_dir and config_data:
-        print(colours.GREEN, "Completed init.")
-        return project_dir, config_data
+    # Found quietly here; if the configuration has to be loaded, conf.main logs its own search
+    project_dir = conf.find_project_dir_quiet(module_dir)
+    # Taken before project.json is read, so an edit made while it is parsed leaves a stale entry, not a wrong one
+    cache_key = config_cache_key(project_dir / "project.json") if project_dir is not None else None
+    config_data = load_cached_configuration(module_dir, project_dir, cache_key) if cache_key is not None else None
+    if config_data is not None:
+        print(colours.GREEN, "Completed init (cached configuration).")
     else:
-        print_error("Initialization failed. Cannot proceed.")
+        loaded_project_dir, config_data = conf.main(module_dir) # Calls Video's conf.main
+        if not (loaded_project_dir and config_data):
+            print_error("Initialization failed. Cannot proceed.")
+            return None, None
+        if cache_key is not None and loaded_project_dir == project_dir:
+            store_cached_configuration(project_dir, config_data, cache_key)
+        project_dir = loaded_project_dir
+        print(colours.GREEN, "Completed init.")
+
+    try:
+        # Get the configured target directory path (relative to project_dir)
+        video_config = VideoConfig(
+            mov_target_dir=config_data['Video']['Directories']['MOV_TARGET_DIR'],
+            raw=config_data,
+        )
+    except KeyError:
+        print_error("Error: 'MOV_TARGET_DIR' not found in Video configuration within project.json.")
         return None, None
+    return project_dir, video_config
 
 # --- Processing Step Function ---
-def run_video_processing(project_dir: Path, module_dir: Path, config_data: Dict[str, Any]) -> None:
+def get_video_process_main():
+    """
+    Returns the video processing module, waiting for the background preload if one is
+    running and importing the module itself otherwise.
+    """
+    global _video_process_main
+    if _video_process_preload is not None and _video_process_preload is not threading.current_thread():
+        _video_process_preload.join() # Let a background import finish rather than racing it
+    if _video_process_main is None:
+        if __package__:
+            from .Tools.process import Main as VideoProcessMain # Specific video processing main function/module
+        else:
+            from Tools.process import Main as VideoProcessMain
+        _video_process_main = VideoProcessMain
+    return _video_process_main
+
+def start_video_process_preload() -> None:
+    """
+    Starts importing the video processing module in a daemon thread, so loading its
+    files overlaps with configuration parsing on the main thread.
+    """
+    global _video_process_preload
+
+    def preload() -> None:
+        try:
+            get_video_process_main()
+        except Exception:
+            pass # Retried on the main thread, which reports the error, if processing runs
+
+    _video_process_preload = threading.Thread(target=preload, name="video-process-preload", daemon=True)
+    _video_process_preload.start()
+
+def run_video_processing(project_dir: Path, module_dir: Path, video_config: Dict[str, Any]) -> None:
     """
     Runs the main video processing step.
     Passes necessary paths/config if required by the processing function.
+
+    Args:
+        project_dir: The project directory.
+        module_dir: The Video module's directory.
+        video_config: The 'Video' section of project.json.
     """
     print(colours.CYAN, "Running main video processing.")
     # time.sleep(2) # Optional delay for testing
     try:
         # Assuming VideoProcessMain.main accepts project_dir and module_dir
-        # Pass config_data as well if the processing step needs direct access to it
-        VideoProcessMain.main(project_dir=project_dir, module_dir=module_dir, config=config_data.get('Video', {}))
+        # Only the 'Video' section of the configuration is passed on
+        VideoProcessMain = get_video_process_main()
+        VideoProcessMain.main(project_dir=project_dir, module_dir=module_dir, config=video_config)
         print(colours.GREEN, "Completed main video processing.")
-    except Exception as e:
+    except (OSError, ValueError, KeyError) as e:
+        # Only recoverable errors are reported here; anything else propagates with its traceback
         print_error(f"Error during video processing: {e}")
         # Decide if you want to raise e or just log and continue/exit
 
+# --- Daemon Mode ---
+def serve_daemon(module_dir: Path) -> None:
+    """
+    Keeps the module resident and runs video processing once for every line read from stdin,
+    so the processing module is imported once and an unchanged project.json is not re-parsed.
+    A line reading 'quit' or 'exit', or the end of input, stops the daemon.
+    """
+    VideoProcessMain = get_video_process_main() # Import up front so no request pays for it
+    print(colours.CYAN, "Video daemon ready. Send a line to run processing, 'quit' to stop.")
+    sys.stdout.flush()
+
+    for line in sys.stdin:
+        if line.strip().lower() in ('quit', 'exit'):
+            break
+        # These lookups are memoized for the life of the process, failures included,
+        # so redo them for each request in case the project or FFmpeg has moved
+        conf.clear_project_json_cache()
+        VideoProcessMain.find_ffmpeg.cache_clear()
+        try:
+            # Served from the configuration cache unless project.json changed since the last request
+            project_dir, video_config = initialize_configuration(module_dir)
+            if project_dir is not None and video_config is not None:
+                run_video_processing(project_dir, module_dir, video_config.raw.get('Video', {}))
+        except SystemExit as e:
+            # The processing step exits on fatal errors; that ends this request, not the daemon
+            print_error(f"Video processing stopped with exit status {e.code}.")
+        except Exception as e:
+            print_error(f"Error during video processing request: {e!r}")
+        sys.stdout.flush()
+
+    print(colours.GREEN, "Video daemon stopped.")
+
 # --- Main Execution Logic ---
-def main() -> None:
-    """Main function to determine and execute the Video module's tasks."""
+def main(daemon: bool = False) -> None:
+    """
+    Main function to determine and execute the Video module's tasks.
+
+    Args:
+        daemon: Stay resident and serve processing requests from stdin (see serve_daemon).
+    """
+
+    module_dir = _MODULE_DIR
 
-    module_dir = Path(__file__).resolve().parent
+    if daemon:
+        serve_daemon(module_dir) # Imports the processing module itself before serving requests
+        return
 
-    project_dir, config_data = initialize_configuration(module_dir)
+    # VIDEO_FORCE_RERUN lets scripted runs decide without a prompt: "1" re-runs, anything else skips
+    force_rerun = os.environ.get("VIDEO_FORCE_RERUN")
+
+    # When this run would neither process nor prompt, an unchanged output directory needs nothing else
+    would_skip = force_rerun != "1" if force_rerun is not None else __name__ != "__main__"
+    if would_skip and last_run_unchanged(module_dir):
+        if VERBOSE: print_verbose("Video output unchanged since the last run; skipping.")
+        return
+
+    # Only overlap the processing import with the config load when this run can go on to process;
+    # otherwise it would usually just report that the output exists, and the import is wasted
+    if not would_skip:
+        start_video_process_preload()
+    project_dir, video_config = initialize_configuration(module_dir)
 
     # Exit if initialization failed
-    if project_dir is None or config_data is None:
+    if project_dir is None or video_config is None:
         sys.exit(1) # Exit with an error code
 
+    # The processing step only needs the 'Video' section of the configuration
+    video_section = video_config.raw.get('Video', {})
+
     # --- Determine if processing needs to run ---
-    try:
-        # Get the configured target directory path (relative to project_dir)
-        target_dir_str = config_data['Video']['Directories']['MOV_TARGET_DIR']
-        target_path = project_dir / target_dir_str
-    except KeyError:
-        print_error("Error: 'MOV_TARGET_DIR' not found in Video configuration within project.json.")
-        sys.exit(1)
+    # Plain strings are enough for the existence check and the messages below
+    target_path = os.path.normpath(os.path.join(str(project_dir), video_config.mov_target_dir))
+    target_name = os.path.basename(target_path)
 
-    print_verbose(f"Checking for video output directory: {target_path}")
+    if VERBOSE: print_verbose(f"Checking for video output directory: {target_path}")
+
+    # Check if the target directory exists (one raw stat, treating a missing path as "not there")
+    try:
+        os.stat(target_path)
+        target_exists = True
+    except (FileNotFoundError, NotADirectoryError):
+        target_exists = False
 
-    # Check if the target directory exists
-    if not target_path.exists():
-        print(colours.YELLOW, f"Output directory '{target_path.name}' not found.")
-        run_video_processing(project_dir, module_dir, config_data)
+    if not target_exists:
+        print(colours.YELLOW, f"Output directory '{target_name}' not found.")
+        run_video_processing(project_dir, module_dir, video_section)
     else:
-        print(colours.YELLOW, f"Output directory '{target_path.name}' already exists.")
+        print(colours.YELLOW, f"Output directory '{target_name}' already exists.")
+        save_last_run_state(module_dir, project_dir, target_path)
 
+        if force_rerun is not None:
+            if force_rerun == "1":
+                run_video_processing(project_dir, module_dir, video_section)
+            else:
+                print(colours.YELLOW, "Skipping video processing (VIDEO_FORCE_RERUN).")
         # If run directly, ask user if they want to re-run processing
-        if __name__ == "__main__":
+        elif __name__ == "__main__":
             user_input = input(f"Do you want to run video processing anyway? (y/n): ").strip().lower()
             if user_input == 'y':
-                run_video_processing(project_dir, module_dir, config_data)
+                run_video_processing(project_dir, module_dir, video_section)
             elif user_input == 'n':
                 print(colours.YELLOW, "Skipping video processing.")
             # else: handle invalid input? For now, just does nothing more.
@@ -94,4 +367,4 @@ def main() -> None:
 
 # --- Script Execution Guard ---
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(daemon='--daemon' in sys.argv[1:])
\ No newline at end of file